@@ -29,12 +29,20 @@ For example:
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import copy
+import functools
+import os
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CFullLoader as _YamlLoader
+except ImportError:  # PyYAML was built without libyaml
+    from yaml import FullLoader as _YamlLoader  # type: ignore[assignment]
+
 from layered_config_tree import (
     ConfigurationError,
     ConfigurationKeyError,
@@ -42,6 +50,34 @@ from layered_config_tree import (
 )
 from layered_config_tree.types import InputData, NestedDict, NestedDictValue, NodeValue
 
+# LayeredConfigTree overrides __setattr__ for config keys, so its internal
+# attributes are set through the base implementation.
+_setattr = object.__setattr__
+
+
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parses the yaml file at ``path``.
+
+    The modification time and size of the file are part of the cache key so
+    that edits to the file on disk invalidate the cached result. Callers must
+    not mutate the returned object.
+
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_layer_index(layers: tuple[str, ...]) -> dict[str, int]:
+    """Maps each layer name to its priority index.
+
+    Every :class:`ConfigNode` with the same layers shares the returned
+    dictionary, so it must not be mutated.
+
+    """
+    return {layer: i for i, layer in enumerate(layers)}
+
 
 class ConfigNode:
     """A priority based configuration value.
@@ -71,11 +107,38 @@ class ConfigNode:
 
     """
 
-    def __init__(self, layers: list[str], name: str):
+    __slots__ = (
+        "_name",
+        "_layers",
+        "_layer_index",
+        "_sources",
+        "_vals",
+        "_set_mask",
+        "_frozen",
+        "_frozen_value",
+        "_accessed",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        layers: Sequence[str],
+        name: str,
+        layer_index: Optional[dict[str, int]] = None,
+    ):
         self._name = name
         self._layers = layers
-        self._values: dict[str, tuple[Optional[str], NodeValue]] = {}
+        self._layer_index = (
+            layer_index if layer_index is not None else _build_layer_index(tuple(layers))
+        )
+        # Values are stored per layer in parallel lists indexed by layer
+        # priority, with a bitmask recording which layers have been set.
+        n_layers = len(layers)
+        self._sources: list[Optional[str]] = [None] * n_layers
+        self._vals: list[Any] = [None] * n_layers
+        self._set_mask = 0
         self._frozen = False
+        self._frozen_value: NodeValue
         self._accessed = False
 
     @property
@@ -92,25 +155,37 @@ class ConfigNode:
     def metadata(self) -> list[dict[str, Union[Optional[str], NodeValue]]]:
         """Returns all values and associated metadata for this node."""
         result = []
-        for layer in self._layers:
-            if layer in self._values:
-                result.append(
-                    {
-                        "layer": layer,
-                        "source": self._values[layer][0],
-                        "value": self._values[layer][1],
-                    }
-                )
+        for i in self._set_indices():
+            result.append(
+                {
+                    "layer": self._layers[i],
+                    "source": self._sources[i],
+                    "value": self._vals[i],
+                }
+            )
+        result.reverse()
         return result
 
+    @property
+    def _values(self) -> dict[str, tuple[Optional[str], NodeValue]]:
+        """A mapping of each set layer to its (source, value) pair."""
+        return {
+            self._layers[i]: (self._sources[i], self._vals[i])
+            for i in reversed(self._set_indices())
+        }
+
     def freeze(self) -> None:
         """Causes the :class:`ConfigNode` node to become read only.
 
         This can be used to create a contract around when the configuration is
-        modifiable.
+        modifiable. The outermost value is resolved once here so that reads
+        of a frozen node don't need to search the layers.
 
         """
         self._frozen = True
+        if self._set_mask:
+            top = self._set_mask.bit_length() - 1
+            self._frozen_value = self._vals[top]
 
     def get_value(self, layer: Optional[str] = None) -> NodeValue:
         """Returns the value at the specified layer.
@@ -129,6 +204,9 @@ class ConfigNode:
             If no value has been set at any layer.
 
         """
+        if self._frozen and self._set_mask and not layer:
+            self._accessed = True
+            return self._frozen_value
         value = self._get_value_with_source(layer)[1]
         self._accessed = True
         return value
@@ -159,26 +237,28 @@ class ConfigNode:
         """
         if self._frozen:
             raise ConfigurationError(
-                f"Frozen ConfigNode {self.name} does not support assignment.", self.name
+                f"Frozen ConfigNode {self._name} does not support assignment.", self._name
             )
 
         layer = layer if layer else self._layers[-1]
-
-        if layer not in self._layers:
+        i = self._layer_index.get(layer)
+        if i is None:
             raise ConfigurationKeyError(
-                f"No layer {layer} in ConfigNode {self.name}.", self.name
+                f"No layer {layer} in ConfigNode {self._name}.", self._name
             )
-        elif layer in self._values:
-            source, value = self._values[layer]
+        bit = 1 << i
+        mask = self._set_mask
+        if mask & bit:
             raise DuplicatedConfigurationError(
                 f"Value has already been set at layer {layer}.",
-                name=self.name,
+                name=self._name,
                 layer=layer,
-                source=source,
-                value=value,
+                source=self._sources[i],
+                value=self._vals[i],
             )
-        else:
-            self._values[layer] = (source, value)
+        self._set_mask = mask | bit
+        self._sources[i] = source
+        self._vals[i] = value
 
     def _get_value_with_source(self, layer: Optional[str]) -> tuple[Optional[str], NodeValue]:
         """Returns a (source, value) tuple at the specified layer.
@@ -197,32 +277,80 @@ class ConfigNode:
             If no value has been set at any layer.
 
         """
-        if layer and layer in self._values:
-            return self._values[layer]
-
-        for layer in reversed(self._layers):
-            if layer in self._values:
-                return self._values[layer]
+        mask = self._set_mask
+        i = self._layer_index.get(layer) if layer else None
+        if i is None or not mask & (1 << i):
+            i = mask.bit_length() - 1
 
-        raise ConfigurationKeyError(
-            f"No value stored in this ConfigNode {self.name}.", self.name
+        if i < 0:
+            raise ConfigurationKeyError(
+                f"No value stored in this ConfigNode {self._name}.", self._name
+            )
+        return self._sources[i], self._vals[i]
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return (
+            self._name,
+            self._layers,
+            self._sources,
+            self._vals,
+            self._set_mask,
+            self._frozen,
+            self._accessed,
         )
 
+    def __setstate__(self, state: Union[tuple[Any, ...], dict[str, Any]]) -> None:
+        if isinstance(state, dict):
+            # Pickled before the parallel-list layout, with values held in a
+            # dictionary of layer -> (source, value).
+            layers = state["_layers"]
+            sources: list[Optional[str]] = [None] * len(layers)
+            vals: list[Any] = [None] * len(layers)
+            set_mask = 0
+            for layer, (source, value) in state["_values"].items():
+                i = layers.index(layer)
+                sources[i] = source
+                vals[i] = value
+                set_mask |= 1 << i
+            name, frozen, accessed = state["_name"], state["_frozen"], state["_accessed"]
+        else:
+            name, layers, sources, vals, set_mask, frozen, accessed = state
+        self._name = name
+        self._layers = layers
+        self._layer_index = _build_layer_index(tuple(layers))
+        self._sources = sources
+        self._vals = vals
+        self._set_mask = set_mask
+        self._frozen = False
+        self._accessed = accessed
+        if frozen:
+            self.freeze()
+
+    def _set_indices(self) -> list[int]:
+        """Returns the indices of all set layers from highest to lowest priority."""
+        indices = []
+        mask = self._set_mask
+        while mask:
+            i = mask.bit_length() - 1
+            indices.append(i)
+            mask ^= 1 << i
+        return indices
+
     def __bool__(self) -> bool:
-        return bool(self._values)
+        return bool(self._set_mask)
 
     def __repr__(self) -> str:
+        layers, sources, vals = self._layers, self._sources, self._vals
         out = []
-        for m in reversed(self.metadata):
-            layer, source, value = m.values()
-            out.append(f"{layer}: {value}\n    source: {source}")
+        for i in self._set_indices():
+            out.append(f"{layers[i]}: {vals[i]}\n    source: {sources[i]}")
         return "\n".join(out)
 
     def __str__(self) -> str:
         if not self:
             return ""
-        layer, _, value = self.metadata[-1].values()
-        return f"{layer}: {value}"
+        i = self._set_mask.bit_length() - 1
+        return f"{self._layers[i]}: {self._vals[i]}"
 
 
 class LayeredConfigTree:
@@ -233,8 +361,11 @@ class LayeredConfigTree:
 
     """
 
+    __slots__ = ("_layers", "_layer_index", "_children", "_frozen", "_name", "__weakref__")
+
     # Define type annotations here since they're indirectly defined below
-    _layers: list[str]
+    _layers: tuple[str, ...]
+    _layer_index: dict[str, int]
     _children: dict[str, Union["LayeredConfigTree", "ConfigNode"]]
     _frozen: bool
     _name: str
@@ -242,8 +373,9 @@ class LayeredConfigTree:
     def __init__(
         self,
         data: Optional[InputData] = None,
-        layers: list[str] = [],
+        layers: Sequence[str] = (),
         name: str = "",
+        layer_index: Optional[dict[str, int]] = None,
     ):
         """
         Parameters
@@ -272,13 +404,24 @@ class LayeredConfigTree:
             A list of layer names. The order in which layers defined
             determines their priority.  Later layers override the values from
             earlier ones.
+        layer_index
+            A precomputed mapping of each layer name to its priority index.
+            This is used to share the parent's mapping with sub-trees and
+            should not otherwise be provided.
 
         """
-        self.__dict__["_layers"] = layers if layers else ["base"]
-        self.__dict__["_children"] = {}
-        self.__dict__["_frozen"] = False
-        self.__dict__["_name"] = name
-        self.update(data, layer=self._layers[0], source="initial data")
+        layers = tuple(layers) if layers else ("base",)
+        _setattr(self, "_layers", layers)
+        _setattr(
+            self,
+            "_layer_index",
+            layer_index if layer_index is not None else _build_layer_index(layers),
+        )
+        _setattr(self, "_children", {})
+        _setattr(self, "_frozen", False)
+        _setattr(self, "_name", name)
+        if data is not None:
+            self.update(data, layer=self._layers[0], source="initial data")
 
     def freeze(self) -> None:
         """Causes the LayeredConfigTree to become read only.
@@ -287,7 +430,7 @@ class LayeredConfigTree:
         should not be modified at runtime.
 
         """
-        self.__dict__["_frozen"] = True
+        _setattr(self, "_frozen", True)
         for child in self.values():
             child.freeze()
 
@@ -321,13 +464,14 @@ class LayeredConfigTree:
         All metadata is lost in this conversion.
 
         """
-        result = {}
-        for name, child in self.items():
-            if isinstance(child, ConfigNode):
-                result[name] = child.get_value(layer=None)
-            else:
-                result[name] = child.to_dict()  # type: ignore[assignment]
-        return result
+        return {
+            name: (
+                child.get_value(layer=None)
+                if isinstance(child, ConfigNode)
+                else child.to_dict()
+            )
+            for name, child in self._children.items()
+        }
 
     def get_from_layer(
         self, name: str, layer: Optional[str] = None
@@ -398,10 +542,36 @@ class LayeredConfigTree:
             is already in the outermost layer and no layer has been provided.
 
         """
-        if data is not None:
+        if data is None:
+            return
+        if not isinstance(data, dict):
             data, source = self._coerce(data, source)
-            for k, v in data.items():
-                self._set_with_metadata(k, v, layer, source)
+        self._update_from_dict(data, layer, source)
+
+    def _update_from_dict(
+        self, data: NestedDict, layer: Optional[str], source: Optional[str]
+    ) -> None:
+        """Adds the contents of a (possibly nested) dictionary to the tree.
+
+        Nested dictionaries are merged depth-first with an explicit stack of
+        (tree, items) pairs rather than by recursing through
+        :func:`~LayeredConfigTree.update`, so building a tree is not bounded
+        by the interpreter recursion limit. Other traversals of the tree,
+        such as :func:`~LayeredConfigTree.freeze` and
+        :func:`~LayeredConfigTree.to_dict`, still recurse.
+
+        """
+        stack = [(self, iter(data.items()))]
+        while stack:
+            tree, items = stack[-1]
+            for name, value in items:
+                child = tree._get_or_create_child(name, value)
+                if isinstance(value, dict):
+                    stack.append((child, iter(value.items())))  # type: ignore[arg-type]
+                    break
+                child.update(value, layer, source)  # type: ignore[arg-type]
+            else:
+                stack.pop()
 
     def metadata(self, name: str) -> list[NestedDict]:
         if name in self:
@@ -421,16 +591,16 @@ class LayeredConfigTree:
             data, Path
         ):
             source = source if source else str(data)
-            with open(data) as f:
-                data = f.read()
-            data = yaml.full_load(data)
+            path = os.path.abspath(data)
+            stat = os.stat(path)
+            data = _load_yaml_cached(path, stat.st_mtime_ns, stat.st_size)
             if not isinstance(data, dict):
                 raise ValueError(
                     f"Loaded yaml file {data} should be a dictionary but is type {type(data)}"
                 )
-            return data, source
+            return copy.deepcopy(data), source
         elif isinstance(data, str):
-            data = yaml.full_load(data)
+            data = yaml.load(data, Loader=_YamlLoader)
             if not isinstance(data, dict):
                 raise ValueError(
                     f"Loaded yaml file {data} should be a dictionary but is type {type(data)}"
@@ -478,6 +648,24 @@ class LayeredConfigTree:
             If a value has already been set at the provided layer or a value
             is already in the outermost layer and no layer has been provided.
 
+        """
+        child = self._get_or_create_child(name, value)
+        child.update(value, layer, source)  # type: ignore[arg-type]
+
+    def _get_or_create_child(
+        self, name: str, value: Union[NestedDictValue, str, Path, "LayeredConfigTree"]
+    ) -> Union["LayeredConfigTree", ConfigNode]:
+        """Returns the child that will hold ``value``, creating it if needed.
+
+        Dictionaries are held by a :class:`LayeredConfigTree` and all other
+        values by a :class:`ConfigNode`.
+
+        Raises
+        ------
+        ConfigurationError
+            If the :class:`LayeredConfigTree` is frozen or the existing child
+            cannot hold the type of ``value``.
+
         """
         if self._frozen:
             raise ConfigurationError(
@@ -485,24 +673,32 @@ class LayeredConfigTree:
                 self._name,
             )
 
+        # Children share this tree's layers tuple and layer index rather than
+        # each building their own.
+        children = self._children
+        child = children.get(name)
         if isinstance(value, dict):
-            if name not in self:
-                self._children[name] = LayeredConfigTree(layers=list(self._layers), name=name)
-            if isinstance(self._children[name], ConfigNode):
+            if child is None:
+                child = children[name] = LayeredConfigTree(
+                    layers=self._layers, name=name, layer_index=self._layer_index
+                )
+            elif isinstance(child, ConfigNode):
                 name = f"{self._name}.{name}" if self._name else name
                 raise ConfigurationError(
                     f"Can't assign a dictionary as a value to a ConfigNode.", name
                 )
         else:
-            if name not in self:
-                self._children[name] = ConfigNode(list(self._layers), name=self._name)
-            if isinstance(self._children[name], LayeredConfigTree):
+            if child is None:
+                child = children[name] = ConfigNode(
+                    self._layers, self._name, self._layer_index
+                )
+            elif isinstance(child, LayeredConfigTree):
                 name = f"{self._name}.{name}" if self._name else name
                 raise ConfigurationError(
                     f"Can't assign a value to a LayeredConfigTree.", name
                 )
 
-        self._children[name].update(value, layer, source)  # type: ignore[arg-type]
+        return child
 
     def __setattr__(self, name: str, value: NestedDictValue) -> None:
         """Set a value on the outermost layer."""
@@ -537,12 +733,20 @@ class LayeredConfigTree:
     # * Calling __getattr__ before we have set up the state doesn't work,
     #   because it leads to an infinite loop looking for the module's
     #   actual attributes (not config keys)
-    def __getstate__(self) -> NestedDict:
-        return self.__dict__
-
-    def __setstate__(self, state: NestedDict) -> None:
-        for k, v in state.items():
-            self.__dict__[k] = v
+    def __getstate__(self) -> tuple[Any, ...]:
+        return self._layers, self._children, self._name, self._frozen
+
+    def __setstate__(self, state: Union[tuple[Any, ...], dict[str, Any]]) -> None:
+        if isinstance(state, dict):
+            # Pickled before the tuple state format
+            state = state["_layers"], state["_children"], state["_name"], state["_frozen"]
+        layers, children, name, frozen = state
+        layers = tuple(layers)
+        _setattr(self, "_layers", layers)
+        _setattr(self, "_layer_index", _build_layer_index(layers))
+        _setattr(self, "_children", children)
+        _setattr(self, "_name", name)
+        _setattr(self, "_frozen", frozen)
 
     def __getitem__(self, name: str) -> Union[NodeValue, "LayeredConfigTree"]:
         """Get a value from the outermost layer in which it appears."""
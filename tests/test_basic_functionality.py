@@ -1,6 +1,9 @@
 import pickle
+import sys
 import textwrap
+import weakref
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
@@ -14,6 +17,51 @@ from layered_config_tree import (
 )
 from layered_config_tree.types import NestedDict
 
+EXPECTED_NODE_REPR_BASE = textwrap.dedent(
+    """\
+    base: test_value
+        source: test"""
+)
+
+EXPECTED_NODE_REPR_LAYER_1 = textwrap.dedent(
+    """\
+    layer_1: test_value
+        source: test"""
+)
+
+EXPECTED_NODE_REPR_BOTH = textwrap.dedent(
+    """\
+    layer_1: test_value
+        source: test
+    base: test_value
+        source: test"""
+)
+
+EXPECTED_TREE_REPR = textwrap.dedent(
+    """\
+    Key1:
+        override_2: value_ov_2
+            source: ov2_src
+        override_1: value_ov_1
+            source: ov1_src
+        base: value_base
+            source: base_src"""
+)
+
+# A LayeredConfigTree pickled by layered_config_tree 2.0.1, with dict based state
+LEGACY_TREE_PICKLE = (
+    b"\x80\x04\x95}\x01\x00\x00\x00\x00\x00\x00\x8c\x18layered_config_tree.main\x94"
+    b"\x8c\x11LayeredConfigTree\x94\x93\x94)\x81\x94}\x94(\x8c\x07_layers\x94]\x94("
+    b"\x8c\x05inner\x94\x8c\x05outer\x94e\x8c\t_children\x94}\x94(\x8c\x08test_key\x94"
+    b"h\x00\x8c\nConfigNode\x94\x93\x94)\x81\x94}\x94(\x8c\x05_name\x94\x8c\x00\x94h"
+    b"\x05]\x94(h\x07h\x08e\x8c\x07_values\x94}\x94(h\x07\x8c\x0cinitial data\x94\x8c"
+    b"\ntest_value\x94\x86\x94h\x08\x8c\x06update\x94\x8c\x0btest_value3\x94\x86\x94u"
+    b"\x8c\x07_frozen\x94\x89\x8c\t_accessed\x94\x89ub\x8c\x0etest_container\x94h\x02)"
+    b"\x81\x94}\x94(h\x05]\x94(h\x07h\x08eh\t}\x94\x8c\ttest_key2\x94h\r)\x81\x94}\x94"
+    b"(h\x10h\x1dh\x05]\x94(h\x07h\x08eh\x13}\x94h\x07h\x15\x8c\x0btest_value2\x94\x86"
+    b"\x94sh\x1b\x89h\x1c\x89ubsh\x1b\x89h\x10h\x1dubuh\x1b\x89h\x10h\x11ub."
+)
+
 
 @pytest.fixture(params=list(range(1, 5)))
 def layers(request: pytest.FixtureRequest) -> list[str]:
@@ -175,37 +223,38 @@ def test_node_get_value(full_node: ConfigNode) -> None:
     assert not full_node.accessed
 
 
+def test_frozen_node_get_value(full_node: ConfigNode) -> None:
+    full_node.freeze()
+    assert full_node.get_value() == f"test_value_{len(full_node._layers)}"
+    assert full_node.accessed
+    for i, layer in enumerate(full_node._layers):
+        assert full_node.get_value(layer=layer) == f"test_value_{i + 1}"
+
+
+def test_frozen_node_get_value_empty(empty_node: ConfigNode) -> None:
+    empty_node.freeze()
+    with pytest.raises(ConfigurationKeyError):
+        empty_node.get_value()
+    assert not empty_node.accessed
+
+
 def test_node_repr() -> None:
     cn = ConfigNode(["base"], name="test_node")
     cn.update("test_value", layer="base", source="test")
-    expected_str = """\
-        base: test_value
-            source: test"""
-    assert repr(cn) == textwrap.dedent(expected_str)
+    assert repr(cn) == EXPECTED_NODE_REPR_BASE
 
     cn = ConfigNode(["base", "layer_1"], name="test_node")
     cn.update("test_value", layer="base", source="test")
-    expected_str = """\
-        base: test_value
-            source: test"""
-    assert repr(cn) == textwrap.dedent(expected_str)
+    assert repr(cn) == EXPECTED_NODE_REPR_BASE
 
     cn = ConfigNode(["base", "layer_1"], name="test_node")
     cn.update("test_value", layer=None, source="test")
-    expected_str = """\
-        layer_1: test_value
-            source: test"""
-    assert repr(cn) == textwrap.dedent(expected_str)
+    assert repr(cn) == EXPECTED_NODE_REPR_LAYER_1
 
     cn = ConfigNode(["base", "layer_1"], name="test_node")
     cn.update("test_value", layer="base", source="test")
     cn.update("test_value", layer="layer_1", source="test")
-    expected_str = """\
-        layer_1: test_value
-            source: test
-        base: test_value
-            source: test"""
-    assert repr(cn) == textwrap.dedent(expected_str)
+    assert repr(cn) == EXPECTED_NODE_REPR_BOTH
 
 
 def test_node_str() -> None:
@@ -411,6 +460,34 @@ def test_update_dict_nested() -> None:
     assert lct.test_container.test_key2 == "test_value4"
 
 
+def test_children_share_layer_index() -> None:
+    lct = LayeredConfigTree({"test_container": {"test_key": "test_value"}})
+    container = lct.test_container
+    assert container._layer_index is lct._layer_index
+    assert container._children["test_key"]._layer_index is lct._layer_index
+
+
+def test_update_dict_deeply_nested() -> None:
+    # Only construction and update avoid recursion; other traversals such as
+    # freeze, to_dict, repr and pickling still recurse through the tree.
+    depth = sys.getrecursionlimit() + 100
+    data: dict[str, Any] = {"test_key": "test_value"}
+    for _ in range(depth):
+        data = {"test_container": data}
+    update: dict[str, Any] = {"test_key2": "test_value2"}
+    for _ in range(depth):
+        update = {"test_container": update}
+
+    lct = LayeredConfigTree(data)
+    lct.update(update, layer="base")
+
+    child = lct
+    for _ in range(depth):
+        child = child.test_container
+    assert child.test_key == "test_value"
+    assert child.test_key2 == "test_value2"
+
+
 def test_source_metadata() -> None:
     lct = LayeredConfigTree(layers=["inner", "outer"])
     lct.update({"test_key": "test_value"}, layer="inner", source="initial_load")
@@ -485,6 +562,44 @@ def test_to_from_pickle() -> None:
     assert unpickled._layers == lct._layers
 
 
+def test_to_from_pickle_frozen() -> None:
+    lct = LayeredConfigTree({"test_key": "test_value"}, layers=["inner", "outer"])
+    lct.update({"test_key": "test_value2"}, layer="outer", source="update")
+    lct.freeze()
+    unpickled = pickle.loads(pickle.dumps(lct))
+
+    assert unpickled._frozen
+    assert unpickled.test_key == "test_value2"
+    assert unpickled.metadata("test_key") == lct.metadata("test_key")
+    with pytest.raises(ConfigurationError):
+        unpickled.update({"test_key2": "test_value3"})
+
+
+def test_from_legacy_pickle() -> None:
+    unpickled = pickle.loads(LEGACY_TREE_PICKLE)
+
+    assert unpickled._layers == ("inner", "outer")
+    assert unpickled._name == ""
+    assert unpickled._frozen is False
+    assert unpickled.to_dict() == {
+        "test_key": "test_value3",
+        "test_container": {"test_key2": "test_value2"},
+    }
+    assert unpickled.metadata("test_key") == [
+        {"layer": "inner", "source": "initial data", "value": "test_value"},
+        {"layer": "outer", "source": "update", "value": "test_value3"},
+    ]
+    unpickled.update({"test_container": {"test_key2": "test_value4"}}, layer="outer")
+    assert unpickled.test_container.test_key2 == "test_value4"
+
+
+def test_weakref() -> None:
+    lct = LayeredConfigTree({"test_key": "test_value"})
+    assert weakref.ref(lct)() is lct
+    node = lct._children["test_key"]
+    assert weakref.ref(node)() is node
+
+
 def test_freeze() -> None:
     lct = LayeredConfigTree(data={"configuration": {"time": {"start": {"year": 2000}}}})
     lct.freeze()
@@ -515,14 +630,6 @@ def test_retrieval_behavior() -> None:
 
 
 def test_repr_display() -> None:
-    expected_repr = """\
-    Key1:
-        override_2: value_ov_2
-            source: ov2_src
-        override_1: value_ov_1
-            source: ov1_src
-        base: value_base
-            source: base_src"""
     # codifies the notion that repr() displays values from most to least overridden
     #  regardless of initialization order
     layers = ["base", "override_1", "override_2"]
@@ -531,10 +638,10 @@ def test_repr_display() -> None:
     lct.update({"Key1": "value_ov_2"}, layer="override_2", source="ov2_src")
     lct.update({"Key1": "value_ov_1"}, layer="override_1", source="ov1_src")
     lct.update({"Key1": "value_base"}, layer="base", source="base_src")
-    assert repr(lct) == textwrap.dedent(expected_repr)
+    assert repr(lct) == EXPECTED_TREE_REPR
 
     lct = LayeredConfigTree(layers=layers)
     lct.update({"Key1": "value_base"}, layer="base", source="base_src")
     lct.update({"Key1": "value_ov_1"}, layer="override_1", source="ov1_src")
     lct.update({"Key1": "value_ov_2"}, layer="override_2", source="ov2_src")
-    assert repr(lct) == textwrap.dedent(expected_repr)
+    assert repr(lct) == EXPECTED_TREE_REPR
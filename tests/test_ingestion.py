@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from layered_config_tree import LayeredConfigTree
+from layered_config_tree.main import _load_yaml_cached
 
 TEST_YAML_ONE = """
 test_section:
@@ -21,6 +22,11 @@ def test_load_yaml_string() -> None:
     assert lct.test_section2.test_key == "test_value3"
 
 
+def test_load_yaml_string_python_tags() -> None:
+    lct = LayeredConfigTree("test_key: !!python/tuple [1, 2]")
+    assert lct.test_key == (1, 2)
+
+
 def test_load_yaml_file(tmp_path: Path) -> None:
     tmp_file = tmp_path / "test_file.yaml"
     tmp_file.write_text(TEST_YAML_ONE)
@@ -31,3 +37,19 @@ def test_load_yaml_file(tmp_path: Path) -> None:
     assert lct.test_section.test_key == "test_value"
     assert lct.test_section.test_key2 == "test_value2"
     assert lct.test_section2.test_key == "test_value3"
+
+
+def test_load_yaml_file_cached(tmp_path: Path) -> None:
+    _load_yaml_cached.cache_clear()
+    tmp_file = tmp_path / "test_file.yaml"
+    tmp_file.write_text(TEST_YAML_ONE)
+
+    lct = LayeredConfigTree(str(tmp_file))
+    lct2 = LayeredConfigTree(str(tmp_file))
+    assert _load_yaml_cached.cache_info().hits == 1
+    assert lct.to_dict() == lct2.to_dict()
+
+    # Edits to the file on disk are picked up
+    tmp_file.write_text(TEST_YAML_ONE + "test_section3:\n    test_key: test_value5\n")
+    lct3 = LayeredConfigTree(str(tmp_file))
+    assert lct3.test_section3.test_key == "test_value5"
@@ -1,5 +1,6 @@
-""" This script updates the README.rst file with the latest information about
-the project. It is intended to be run from the github "update README" workflow.
+""" This script updates the README.rst file and the pyproject.toml python
+requirement with the latest information about the project. It is intended to be
+run from the github "update README" workflow.
 """
 
 import json
@@ -12,6 +13,7 @@ with open("python_versions.json", "r") as f:
     versions = json.load(f)
 versions_str = ", ".join(versions)
 versions = [parse(v) for v in versions]
+min_version = min(versions).base_version
 max_version = max(versions).base_version
 
 # Open README and replace python versions
@@ -30,3 +32,15 @@ readme = re.sub(r"python=\d+\.\d+", "python=" + max_version, readme)
 # Write the updated README back to file
 with open("README.rst", "w") as file:
     file.write(readme)
+
+# Update the supported python range in pyproject.toml
+max_major, max_minor = max(versions).release[:2]
+with open("pyproject.toml", "r") as file:
+    pyproject = file.read()
+pyproject = re.sub(
+    r'requires-python = ".*"',
+    f'requires-python = ">={min_version},<{max_major}.{max_minor + 1}"',
+    pyproject,
+)
+with open("pyproject.toml", "w") as file:
+    file.write(pyproject)